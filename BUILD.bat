@@ -14,28 +14,51 @@ if errorlevel 1 (
 )
 
 echo Step 1: Installing dependencies...
-pip install pyinstaller pyautogui opencv-python numpy pytesseract mss Pillow tzdata
+pip install "pyinstaller>=6.2" pyautogui opencv-python numpy pytesseract mss Pillow tzdata
 
 echo.
 echo Step 2: Building executable...
-pyinstaller --name=ChatStatusMonitor --onefile --windowed --noconfirm --clean chat_monitor_gui.py
+REM build_exe.py sets PYTHONOPTIMIZE, the build caches and UPX before running the spec
+python build_exe.py --rebuild
+if errorlevel 1 goto failed
+
+REM Report the layout that was just built (same switch build_exe.py and the spec read),
+REM not whichever exe happens to be left in dist\ from an earlier build
+set "ONEFILE=1"
+if "%PYINSTALLER_BUILD_ONEFILE%"=="" set "ONEFILE=0"
+if "%PYINSTALLER_BUILD_ONEFILE%"=="0" set "ONEFILE=0"
 
 echo.
 echo ============================================================
-if exist "dist\ChatStatusMonitor.exe" (
+if "%ONEFILE%"=="1" (
+    if not exist "dist\ChatStatusMonitor.exe" goto failed
     echo   BUILD SUCCESSFUL!
     echo ============================================================
     echo.
     echo Your executable is ready at:
     echo   dist\ChatStatusMonitor.exe
     echo.
-    echo You can copy this file anywhere and run it!
-    echo Make sure Tesseract OCR is installed on the target computer.
+    echo Copy it anywhere and run it!
 ) else (
-    echo   BUILD FAILED
+    if not exist "dist\ChatStatusMonitor\ChatStatusMonitor.exe" goto failed
+    echo   BUILD SUCCESSFUL!
     echo ============================================================
-    echo Please check the error messages above.
+    echo.
+    echo Your executable is ready at:
+    echo   dist\ChatStatusMonitor\ChatStatusMonitor.exe
+    echo.
+    echo Copy the whole ChatStatusMonitor folder anywhere and run it!
 )
+echo Make sure Tesseract OCR is installed on the target computer.
+goto done
+
+:failed
+echo.
+echo ============================================================
+echo   BUILD FAILED
+echo ============================================================
+echo Please check the error messages above.
 
+:done
 echo.
 pause
\ No newline at end of file
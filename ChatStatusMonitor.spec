@@ -0,0 +1,104 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# PyInstaller spec for Chat Status Monitor
+# Build with:  python build_exe.py   (or: pyinstaller --noconfirm ChatStatusMonitor.spec)
+#
+# Set PYINSTALLER_BUILD_ONEFILE=1 to get a single .exe instead of the
+# ChatStatusMonitor/ folder.
+
+import os
+import shutil
+import sys
+
+ONEFILE = os.environ.get("PYINSTALLER_BUILD_ONEFILE", "") not in ("", "0")
+
+# Modules the app never uses but PyInstaller pulls in anyway.
+# To find more candidates, build with --log-level=INFO and look through
+# .pyi-cache/build/ChatStatusMonitor/xref-ChatStatusMonitor.html
+EXCLUDES = [
+    "tkinter.test",
+    "unittest",
+    "pydoc_data",
+    "test",
+    "xmlrpc",
+    "distutils",
+    "lib2to3",
+    "pip",
+    "setuptools",
+    "numpy.tests",
+    "PIL.ImageQt",
+]
+
+# Strip symbol tables from bundled binaries when `strip` is available.
+# Not on Windows: MSVC-built DLLs keep no symbols in the file (they live in
+# .pdb files), and GNU strip can corrupt them.
+STRIP = sys.platform != "win32" and shutil.which("strip") is not None
+
+# DLLs that are known to crash or fail to load after UPX compression
+UPX_EXCLUDE = [
+    "vcruntime140.dll",
+    "vcruntime140_1.dll",
+    f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+    "python3.dll",
+    "tcl86t.dll",
+    "tk86t.dll",
+]
+
+
+a = Analysis(
+    ["chat_monitor_gui.py"],
+    pathex=[],
+    binaries=[],
+    datas=[],   # README.md is copied next to the exe by build_exe.py
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=EXCLUDES,
+    noarchive=not ONEFILE,   # onedir: plain .pyc files in lib/, no PYZ archive lookups
+)
+pyz = PYZ(a.pure)
+
+if ONEFILE:
+    # Single .exe file (extracts to temp on every launch)
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name="ChatStatusMonitor",
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=STRIP,
+        upx=True,
+        upx_exclude=UPX_EXCLUDE,
+        runtime_tmpdir="%LOCALAPPDATA%\\ChatStatusMonitor",   # Unpack here instead of %TEMP%
+        console=False,
+        disable_windowed_traceback=False,
+    )
+else:
+    # Folder build: exe starts without unpacking, dependencies go in lib/
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name="ChatStatusMonitor",
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=STRIP,
+        upx=True,
+        console=False,
+        disable_windowed_traceback=False,
+        contents_directory="lib",
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=STRIP,
+        upx=True,
+        upx_exclude=UPX_EXCLUDE,
+        name="ChatStatusMonitor",
+    )
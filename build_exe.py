@@ -4,63 +4,167 @@ Build Script for Chat Status Monitor
 Creates a standalone Windows executable (.exe)
 
 Usage:
-    python build_exe.py
+    python build_exe.py             (incremental build, reuses .pyi-cache/)
+    python build_exe.py --rebuild   (discard cached analysis and build from scratch)
+
+In CI, cache the .pip-cache/ and .pyi-cache/ folders (e.g. keyed on
+requirements.txt + build_exe.py) to skip downloads and re-analysis.
+
+Set PYI_WORKPATH to a RAM disk folder to keep PyInstaller's temp files off
+the hard drive.
+
+Set PYINSTALLER_BUILD_ONEFILE=1 to build a single .exe instead of the
+(faster starting) ChatStatusMonitor/ folder.
 
 Requirements:
-    pip install pyinstaller
+    pip install "pyinstaller>=6.2"
 """
 
 import subprocess
+import shutil
 import sys
 import os
+from importlib.metadata import version, PackageNotFoundError
+
+ONEFILE = os.environ.get("PYINSTALLER_BUILD_ONEFILE", "") not in ("", "0")
+SPEC_FILE = "ChatStatusMonitor.spec"    # Bundle layout, excludes, UPX excludes
+# Set PYI_WORKPATH to put PyInstaller's temp files somewhere faster (e.g. a RAM disk)
+WORKPATH = os.environ.get("PYI_WORKPATH") or os.path.join(".pyi-cache", "build")
+MIN_FREE_MB = 1024
+MIN_PYINSTALLER = (6, 2)   # The spec uses contents_directory=
+CONFIG_DIR = os.path.join(".pyi-cache", "config")   # PyInstaller's bincache
+PIP_CACHE_DIR = ".pip-cache"                         # Downloaded wheels
+
+
+def write_block(*lines):
+    """Print several lines with a single console write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def version_tuple(text):
+    """(major, minor) of a version string like '6.10.0' or '5.13.2.dev0'"""
+    parts = []
+    for part in text.split(".")[:2]:
+        digits = ""
+        for ch in part:
+            if not ch.isdigit():
+                break
+            digits += ch
+        parts.append(int(digits or 0))
+    return tuple(parts + [0] * (2 - len(parts)))
+
+
+def pip_install(*args):
+    """Install packages with pip, in-process when possible to skip a second interpreter start"""
+    pip_args = ["install", "--prefer-binary", "--no-input", "--cache-dir", PIP_CACHE_DIR, *args]
+    try:
+        from pip._internal.cli.main import main as pip_main   # Private API, may change
+        if pip_main(pip_args) == 0:
+            return
+    except Exception as e:
+        print(f"In-process pip unavailable ({e}), falling back to subprocess")
+    subprocess.check_call([sys.executable, "-m", "pip", *pip_args])
+
 
 def main():
-    print("=" * 60)
-    print("  Building Chat Status Monitor Standalone Executable")
-    print("=" * 60)
+    rebuild = "--rebuild" in sys.argv[1:]
+    
+    write_block(
+        "=" * 60,
+        "  Building Chat Status Monitor Standalone Executable",
+        "=" * 60,
+    )
     
-    # Check if PyInstaller is installed
+    # Check if PyInstaller is installed and new enough (reads package metadata, no import)
     try:
-        import PyInstaller
-        print("✓ PyInstaller found")
-    except ImportError:
+        installed = version('pyinstaller')
+    except PackageNotFoundError:
+        installed = None
+    if installed is None:
         print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        pip_install("pyinstaller>=6.2")
         print("✓ PyInstaller installed")
+    elif version_tuple(installed) < MIN_PYINSTALLER:
+        print(f"PyInstaller {installed} is too old for the spec file, upgrading...")
+        pip_install("--upgrade", "pyinstaller>=6.2")
+        print("✓ PyInstaller upgraded")
+    else:
+        print(f"✓ PyInstaller {installed} found")
     
-    # PyInstaller command
+    # PyInstaller command (everything else is configured in the spec file)
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--name=ChatStatusMonitor",
-        "--onefile",              # Single .exe file
-        "--windowed",             # No console window (GUI app)
+        SPEC_FILE,
         "--noconfirm",            # Overwrite without asking
-        "--clean",                # Clean build files
-        "--add-data", f"README.md{os.pathsep}.",  # Include README
-        "chat_monitor_gui.py"
+        "--workpath", WORKPATH,   # Keep analysis cache between builds
+        "--distpath", "dist",
+        "--log-level=WARN",       # Less console output while analysing
     ]
     
-    print("\nRunning PyInstaller...")
-    print(f"Command: {' '.join(cmd)}\n")
+    if rebuild:
+        cmd.append("--clean")     # Throw away cached analysis
+    
+    # PyInstaller writes a few hundred MB while building
+    os.makedirs(WORKPATH, exist_ok=True)
+    free_mb = shutil.disk_usage(WORKPATH).free // (1024 * 1024)
+    if free_mb < MIN_FREE_MB:
+        print(f"⚠️ Only {free_mb} MB free for {WORKPATH} - the build may fail")
+    
+    # Compress DLLs/pyds with UPX when it is installed (optional)
+    upx_path = shutil.which("upx")
+    if upx_path:
+        print(f"✓ UPX found: {upx_path}")
+        cmd += ["--upx-dir", os.path.dirname(upx_path)]
+    else:
+        print("UPX not found - building without compression (get it from https://upx.github.io)")
+    
+    # Compile bundled modules at -OO (strips asserts and docstrings)
+    env = os.environ.copy()
+    env["PYTHONOPTIMIZE"] = "2"
+    env["PYINSTALLER_CONFIG_DIR"] = os.path.abspath(CONFIG_DIR)
+    os.makedirs(CONFIG_DIR, exist_ok=True)
     
     try:
-        subprocess.check_call(cmd)
-        print("\n" + "=" * 60)
-        print("  BUILD SUCCESSFUL!")
-        print("=" * 60)
-        print("\nYour executable is at:")
-        print("  dist/ChatStatusMonitor.exe")
-        print("\nTo use it:")
-        print("  1. Copy ChatStatusMonitor.exe to any folder")
-        print("  2. Make sure Tesseract OCR is installed")
-        print("  3. Double-click to run!")
-        print("\nNote: First run may take a few seconds to start.")
+        write_block("", "Running PyInstaller...", f"Command: PYTHONOPTIMIZE=2 {' '.join(cmd)}", "")
+        
+        subprocess.check_call(cmd, env=env)
+        
+        # Ship README alongside the exe rather than inside the bundle
+        shutil.copy("README.md", "dist" if ONEFILE else os.path.join("dist", "ChatStatusMonitor"))
+        
+        if ONEFILE:
+            exe_path = "dist/ChatStatusMonitor.exe"
+            copy_step = "  1. Copy ChatStatusMonitor.exe to any folder"
+        else:
+            exe_path = "dist/ChatStatusMonitor/ChatStatusMonitor.exe"
+            copy_step = "  1. Copy the whole ChatStatusMonitor/ folder (exe + lib/) anywhere"
+        write_block(
+            "",
+            "=" * 60,
+            "  BUILD SUCCESSFUL!",
+            "=" * 60,
+            "",
+            "Your executable is at:",
+            f"  {exe_path}",
+            "",
+            "To use it:",
+            copy_step,
+            "  2. Make sure Tesseract OCR is installed",
+            "  3. Double-click to run!",
+            *(["", "Note: First run may take a few seconds to start."] if ONEFILE else []),
+        )
         
     except subprocess.CalledProcessError as e:
-        print(f"\nBuild failed with error: {e}")
-        print("\nTry running manually:")
-        print("  pip install pyinstaller")
-        print("  pyinstaller --onefile --windowed chat_monitor_gui.py")
+        write_block(
+            "",
+            f"Build failed with error: {e}",
+            "",
+            "Try running manually:",
+            '  pip install "pyinstaller>=6.2"',
+            f"  pyinstaller --noconfirm {SPEC_FILE}",
+        )
+        sys.exit(1)   # Let BUILD.bat / CI see the failure
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
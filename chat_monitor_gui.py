@@ -13,21 +13,29 @@ Also install Tesseract OCR:
     Download from: https://github.com/UB-Mannheim/tesseract/wiki
 """
 
+from __future__ import annotations
+
+import os
+# Tesseract's OpenMP threads cost more than they save on small images. Must be set
+# before tesserocr loads (pytesseract passes it on to tesseract.exe).
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import cv2
 import numpy as np
 import pytesseract
 from mss import mss
 from PIL import Image, ImageDraw, ImageTk
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 import time
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
-import os
+import re
 from typing import Optional, Tuple
+from functools import lru_cache
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import sys
 
@@ -36,6 +44,12 @@ try:
 except ImportError:
     from backports.zoneinfo import ZoneInfo
 
+# Email schedule timezone, resolved once (None = tzdata missing, use local time)
+try:
+    BERLIN_TZ = ZoneInfo("Europe/Berlin")
+except Exception:
+    BERLIN_TZ = None
+
 # Try to import pystray for system tray
 try:
     import pystray
@@ -46,6 +60,150 @@ except ImportError:
     print("Note: pystray not installed. System tray feature disabled.")
     print("Install with: pip install pystray")
 
+# Optional: tesserocr runs Tesseract in-process (no tesseract.exe launch + temp files per OCR)
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional: orjson reads/writes the config file faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: DXcam (or its maintained fork bettercam, same API) grabs through DXGI
+# Desktop Duplication on Windows, faster than mss's GDI BitBlt
+DXCAM_AVAILABLE = False
+if sys.platform == "win32":
+    try:
+        import bettercam as dxcam
+        DXCAM_AVAILABLE = True
+    except ImportError:
+        try:
+            import dxcam
+            DXCAM_AVAILABLE = True
+        except ImportError:
+            pass
+
+# Run with --debug to print colour counts and save debug_context.png on each check
+DEBUG = "--debug" in sys.argv[1:]
+# Folder of the script (or of the .exe when frozen), resolved once
+_APP_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, "frozen", False) else __file__))
+_DEBUG_CONTEXT_PATH = os.path.join(_APP_DIR, "debug_context.png")
+
+# Optional: numba fuses HSV conversion + colour counting into one pixel pass
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _count_status_pixels(bgr):
+    """Count green/red/yellow pixels of a BGR patch (same HSV ranges as the cv2.inRange path)"""
+    green = red = yellow = 0
+    for i in range(bgr.shape[0]):
+        for j in range(bgr.shape[1]):
+            b = np.int32(bgr[i, j, 0])
+            g = np.int32(bgr[i, j, 1])
+            r = np.int32(bgr[i, j, 2])
+            v = max(r, g, b)
+            diff = v - min(r, g, b)
+            if v < 80 or diff == 0:
+                continue
+            
+            # Same fixed-point maths as OpenCV's 8-bit BGR2HSV (hue 0-179)
+            sat = (diff * int((255 << 12) / v + 0.5) + 2048) >> 12
+            if sat < 80:
+                continue
+            if v == r:
+                hue = g - b
+            elif v == g:
+                hue = b - r + 2 * diff
+            else:
+                hue = r - g + 4 * diff
+            hue = (hue * int((180 << 12) / (6 * diff) + 0.5) + 2048) >> 12
+            if hue < 0:
+                hue += 180
+            
+            if 35 <= hue <= 85:
+                green += 1
+            if hue <= 10 or hue >= 160:
+                red += 1
+            if 15 <= hue <= 35:
+                yellow += 1
+    return green, red, yellow
+
+
+if NUMBA_AVAILABLE:
+    # No on-disk cache in the frozen .exe: its source file isn't shipped, and numba's
+    # cache raises at decoration time when it can't locate the file
+    try:
+        _count_status_pixels = njit(cache=not getattr(sys, "frozen", False))(_count_status_pixels)
+    except Exception as e:
+        NUMBA_AVAILABLE = False  # Fall back to the cv2 counting path
+        print(f"Note: numba unavailable ({e}), using OpenCV colour counting")
+
+# Hue (0-179) -> colour bits for the cv2 path: 1 = green, 2 = red, 4 = yellow.
+# All three colours share the same sat/val floor, so only hue needs a per-colour test.
+_HUE_BITS = np.zeros(256, np.uint8)
+_HUE_BITS[35:86] |= 1
+_HUE_BITS[0:11] |= 2
+_HUE_BITS[160:181] |= 2
+_HUE_BITS[15:36] |= 4
+_SV_LO = np.array([0, 80, 80], np.uint8)
+_SV_HI = np.array([180, 255, 255], np.uint8)
+
+# OCR often drops the dots from umlauts
+_UMLAUT_TRANS = str.maketrans({'ü': 'u', 'ä': 'a', 'ö': 'o'})
+
+
+@lru_cache(maxsize=64)
+def get_word_variants(word):
+    """Spellings OCR may produce for a name word with special characters"""
+    variants = {word, word.translate(_UMLAUT_TRANS)}
+    if 'ß' in word:
+        variants.update((word.replace('ß', 'ss'), word.replace('ß', 'b')))
+    return tuple(variants)
+
+
+@lru_cache(maxsize=16)
+def compile_target(target):
+    """Matchers for a target name, built once per name: (first word, second word).
+    The second-word matcher is None for single-word names."""
+    words = target.lower().split()
+    first = words[0]
+    # An OCR token is a candidate if it contains the first word or starts like it
+    first_match = re.compile(f"^{re.escape(first[:3])}|{re.escape(first)}").search
+    if len(words) < 2:
+        return first_match, None
+    
+    # A nearby token matches the second word if it contains the first 4 letters of a spelling
+    # variant, or its own first 4 letters appear in one (NUL never occurs in OCR text)
+    variants = get_word_variants(words[1])
+    contains_prefix = re.compile("|".join(re.escape(v[:4]) for v in variants)).search
+    joined = "\0".join(variants)
+    return first_match, lambda token: contains_prefix(token) is not None or token[:4] in joined
+
+
+class MssSession:
+    """An mss session owned by one thread.
+    mss 9.0-10.1 keeps its Windows GDI handles in a threading.local set up in __init__, so a
+    session can only grab on the thread that created it. Each capturing thread keeps its own
+    in a threading.local; it is closed when that thread ends and drops its locals."""
+    
+    def __init__(self):
+        self.sct = mss()
+    
+    def __del__(self):
+        try:
+            self.sct.close()
+        except Exception:
+            pass
+
 
 class RegionSelector:
     """Fullscreen overlay to select a region - supports multiple monitors"""
@@ -59,7 +217,8 @@ class RegionSelector:
         
     def select(self):
         """Show overlay on ALL monitors and let user draw a rectangle"""
-        # Get all monitors info
+        # Get all monitors info. A fresh mss session on purpose: mss caches the monitor
+        # layout per instance, and the app's long-lived ones would miss newly plugged screens.
         with mss() as sct:
             # monitors[0] is the "all monitors" combined, monitors[1], [2], etc are individual
             all_monitors = sct.monitors[0]  # Combined bounding box of all monitors
@@ -67,6 +226,7 @@ class RegionSelector:
             self.offset_y = all_monitors['top']
             self.total_width = all_monitors['width']
             self.total_height = all_monitors['height']
+            monitors = sct.monitors[1:]  # Skip the "all" monitor
             
             # Take screenshot of ALL monitors
             screenshot = sct.grab(all_monitors)
@@ -103,23 +263,22 @@ class RegionSelector:
         )
         
         # Instructions - show on each monitor
-        with mss() as sct:
-            for i, mon in enumerate(sct.monitors[1:], 1):  # Skip the "all" monitor
-                # Calculate position relative to combined screenshot
-                text_x = mon['left'] - self.offset_x + mon['width'] // 2
-                text_y = mon['top'] - self.offset_y + 50
-                
-                # Background for text
-                self.canvas.create_rectangle(
-                    text_x - 350, text_y - 30,
-                    text_x + 350, text_y + 30,
-                    fill='black', outline='white'
-                )
-                self.canvas.create_text(
-                    text_x, text_y,
-                    text=f"Monitor {i}: 🖱️ CLICK and DRAG to select chat list area  |  ESC to cancel",
-                    fill='white', font=('Arial', 14, 'bold')
-                )
+        for i, mon in enumerate(monitors, 1):
+            # Calculate position relative to combined screenshot
+            text_x = mon['left'] - self.offset_x + mon['width'] // 2
+            text_y = mon['top'] - self.offset_y + 50
+            
+            # Background for text
+            self.canvas.create_rectangle(
+                text_x - 350, text_y - 30,
+                text_x + 350, text_y + 30,
+                fill='black', outline='white'
+            )
+            self.canvas.create_text(
+                text_x, text_y,
+                text=f"Monitor {i}: 🖱️ CLICK and DRAG to select chat list area  |  ESC to cancel",
+                fill='white', font=('Arial', 14, 'bold')
+            )
         
         # Bind mouse events
         self.canvas.bind('<ButtonPress-1>', self.on_mouse_down)
@@ -275,6 +434,18 @@ class ChatStatusMonitorV2:
     """Main application with Region Selection and System Tray"""
     
     CONFIG_FILE = "monitor_config_v2.json"
+    SIDEBAR_WIDTH = 400  # Names are OCR'd only in the leftmost N px of the region
+    OCR_CONFIG = "--oem 1 --psm 6"  # LSTM engine only; sidebar is one text column - skip layout analysis
+    STATUS_DOT_RADIUS = 6  # Half-size of the box checked around the calibrated status dot
+    OCR_CACHE_SIZE = 32  # Sidebar looks remembered by find_name_in_region
+    OCR_TEXT_HEIGHT = 24  # Word box height (px) to scale taller text down to before OCR
+    TEMPLATE_MIN_SCORE = 0.9  # matchTemplate score needed to trust the name template
+    TEMPLATE_MAX_HITS = 20  # Re-run OCR after this many template matches in a row
+    IDLE_MAX_DELAY = 30  # Longest gap (s) between checks while the screen isn't changing
+    SMTP_IDLE_TIMEOUT = 240  # Servers drop idle sessions after ~5 min - reconnect instead of probing
+    PREVIEW_MAX_SIZE = (800, 800)  # Preview windows shrink larger captures to fit
+    SMTP_TIMEOUT = 30  # Seconds - a stalled server must not hold email_lock forever
+    SMTP_MAX_MESSAGES = 100  # Start a new session after this many sends (per-connection provider limits)
     
     def __init__(self):
         self.root = tk.Tk()
@@ -286,21 +457,98 @@ class ChatStatusMonitorV2:
         # State
         self.running = False
         self.monitor_thread = None
+        self.stop_event = threading.Event()  # Set to stop the running monitor thread
         self.tray_icon = None
+        self.tray_parts = None  # (icon image, menu), built on first minimize_to_tray
         self.region = None  # (x1, y1, x2, y2)
         self.status_position = None  # (rel_x, rel_y) relative to name
         self.last_status = None
-        self.last_email_time = None
+        self.last_email_time = None  # time.monotonic() of the last email sent
         self.last_notified_status = None
+        self.last_ui_texts = None  # Label texts last posted by the monitor thread
+        self.last_look = None  # Hash of the previous check's capture
+        self.last_found = None  # (look, target, region, status position, status) of the last hit
+        self.smtp = None  # Logged-in SMTP session, reused between emails
+        self.smtp_key = None  # (server, port, user, password) it was opened with
+        self.smtp_used = 0.0  # time.monotonic() of its last use
+        self.smtp_sent = 0  # Messages sent on it so far
+        self.email_lock = threading.Lock()  # Serialises sends (rate limit + shared session)
+        self.config_mtime = None  # CONFIG_FILE mtime at our last load/save
+        self.saved_config = None  # What we last wrote to CONFIG_FILE
+        self._ocr_cache = OrderedDict()  # (target, tesseract path, sidebar hash) -> name box, LRU
+        self._ocr_cache_lock = threading.Lock()  # Monitor thread and Test both use it
+        self.ocr_buffers = threading.local()  # Per-thread gray/binary images reused across OCR runs
+        self.ocr_scale = 1.0  # Resize factor for OCR, learned from the last run's text height
+        self.name_template = None  # Gray crop of the name from the last OCR hit
+        self.name_template_key = None  # (target, tesseract path) it was cut for
+        self.template_hits = 0  # Template matches since the last OCR
+        self.ocr_state_lock = threading.Lock()  # Guards the template state and ocr_scale (monitor + Test threads)
+        self.tess_api = None  # tesserocr engine, created on first OCR
+        self.tess_api_path = None  # Tesseract path it was created for
+        self.tess_lock = threading.Lock()
+        self.closing = False  # Set by exit_app - no more native engines after that
+        
+        # Screen grabbers: one mss session per capturing thread (see MssSession), one DXcam camera
+        self.sct_local = threading.local()
+        self.sct_lock = threading.Lock()
+        self.dx_camera = None
+        self.dx_frames = {}  # region -> last DXcam frame
+        self.grab = self._make_grabber()
+        
+        # Compile the colour kernel in the background so the first check isn't slow
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=_count_status_pixels, args=(np.zeros((4, 4, 3), np.uint8),), daemon=True).start()
         
         # Setup
         self.setup_scrollable_frame()
         self.setup_ui()
+        
+        # Keep a plain-Python copy of the settings for the worker threads
+        self.settings = {}
+        for var in (self.interval_var, self.person_var, self.tess_path_var,
+                    self.notify_green, self.notify_red, self.email_enabled,
+                    self.email_start_hour, self.email_rate_limit, self.smtp_server_var, self.smtp_port_var,
+                    self.sender_email_var, self.sender_password_var, self.recipient_email_var):
+            var.trace_add("write", self.snapshot_settings)
+        self.snapshot_settings()
+        
         self.load_config()
         
+        # Load Tesseract in the background (needs the configured path from load_config)
+        threading.Thread(target=self.warm_up_ocr, args=(self.tesseract_path.get(),), daemon=True).start()
+        
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
+    def snapshot_settings(self, *_):
+        """Copy the settings the monitor/test threads need out of Tk (runs on the Tk thread)"""
+        # Point pytesseract at the configured exe once per change, not every OCR
+        tess_path = self.tess_path_var.get()
+        if tess_path != self.settings.get("tess_path") and os.path.exists(tess_path):
+            pytesseract.pytesseract.tesseract_cmd = tess_path
+        
+        def as_int(var, key, default, minimum=0):
+            try:
+                return max(minimum, int(var.get()))
+            except ValueError:
+                return self.settings.get(key, default)  # Half-typed value - keep the old one
+        
+        self.settings = {
+            "interval": as_int(self.interval_var, "interval", 3, minimum=1),
+            "target": self.person_var.get(),
+            "tess_path": tess_path,
+            "notify_green": self.notify_green.get(),
+            "notify_red": self.notify_red.get(),
+            "email_enabled": self.email_enabled.get(),
+            "email_start_hour": as_int(self.email_start_hour, "email_start_hour", 9),
+            "email_rate_limit": as_int(self.email_rate_limit, "email_rate_limit", 60),
+            "smtp_server": self.smtp_server_var.get(),
+            "smtp_port": as_int(self.smtp_port_var, "smtp_port", 587),
+            "sender_email": self.sender_email_var.get(),
+            "sender_password": self.sender_password_var.get(),
+            "recipient_email": self.recipient_email_var.get(),
+        }
+    
     def setup_scrollable_frame(self):
         """Create scrollable container"""
         self.canvas = tk.Canvas(self.root)
@@ -320,7 +568,12 @@ class ChatStatusMonitorV2:
         self.canvas.pack(side="left", fill="both", expand=True)
         
         # Mousewheel scrolling
-        self.canvas.bind_all("<MouseWheel>", lambda e: self.canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the settings panel - but not for wheel events in other windows (previews, overlays)"""
+        if isinstance(event.widget, tk.Misc) and event.widget.winfo_toplevel() is self.root:
+            self.canvas.yview_scroll(int(-event.delta / 120), "units")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -349,7 +602,8 @@ class ChatStatusMonitorV2:
         person_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(person_frame, text="Name to monitor:").pack(anchor=tk.W)
-        self.person_entry = ttk.Entry(person_frame, width=40)
+        self.person_var = tk.StringVar()
+        self.person_entry = ttk.Entry(person_frame, width=40, textvariable=self.person_var)
         self.person_entry.pack(fill=tk.X, pady=2)
         self.person_entry.insert(0, "Arne Kaulfuß")
         
@@ -373,7 +627,8 @@ class ChatStatusMonitorV2:
         path_frame.pack(fill=tk.X)
         
         ttk.Label(path_frame, text="Path:").pack(side=tk.LEFT)
-        self.tesseract_path = ttk.Entry(path_frame, width=35)
+        self.tess_path_var = tk.StringVar()
+        self.tesseract_path = ttk.Entry(path_frame, width=35, textvariable=self.tess_path_var)
         self.tesseract_path.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         self.tesseract_path.insert(0, r"C:\Program Files\Tesseract-OCR\tesseract.exe")
         ttk.Button(path_frame, text="Browse", command=self.browse_tesseract).pack(side=tk.LEFT)
@@ -390,25 +645,30 @@ class ChatStatusMonitorV2:
         smtp_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(smtp_frame, text="SMTP:").grid(row=0, column=0, sticky=tk.W)
-        self.smtp_server = ttk.Entry(smtp_frame, width=25)
+        self.smtp_server_var = tk.StringVar()
+        self.smtp_server = ttk.Entry(smtp_frame, width=25, textvariable=self.smtp_server_var)
         self.smtp_server.grid(row=0, column=1, padx=2)
         self.smtp_server.insert(0, "smtp.gmail.com")
         
         ttk.Label(smtp_frame, text="Port:").grid(row=0, column=2, padx=(10,0))
-        self.smtp_port = ttk.Entry(smtp_frame, width=6)
+        self.smtp_port_var = tk.StringVar()
+        self.smtp_port = ttk.Entry(smtp_frame, width=6, textvariable=self.smtp_port_var)
         self.smtp_port.grid(row=0, column=3, padx=2)
         self.smtp_port.insert(0, "587")
         
         ttk.Label(smtp_frame, text="From:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.sender_email = ttk.Entry(smtp_frame, width=35)
+        self.sender_email_var = tk.StringVar()
+        self.sender_email = ttk.Entry(smtp_frame, width=35, textvariable=self.sender_email_var)
         self.sender_email.grid(row=1, column=1, columnspan=3, sticky=tk.W, pady=2)
         
         ttk.Label(smtp_frame, text="Password:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.sender_password = ttk.Entry(smtp_frame, width=35, show="*")
+        self.sender_password_var = tk.StringVar()
+        self.sender_password = ttk.Entry(smtp_frame, width=35, show="*", textvariable=self.sender_password_var)
         self.sender_password.grid(row=2, column=1, columnspan=3, sticky=tk.W, pady=2)
         
         ttk.Label(smtp_frame, text="To:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.recipient_email = ttk.Entry(smtp_frame, width=35)
+        self.recipient_email_var = tk.StringVar()
+        self.recipient_email = ttk.Entry(smtp_frame, width=35, textvariable=self.recipient_email_var)
         self.recipient_email.grid(row=3, column=1, columnspan=3, sticky=tk.W, pady=2)
         
         # Email schedule
@@ -467,7 +727,6 @@ class ChatStatusMonitorV2:
         """Let user select the chat list region on any monitor"""
         # Minimize main window to avoid interference
         self.root.iconify()
-        time.sleep(0.3)
         
         def on_region_selected(region):
             self.root.deiconify()
@@ -490,8 +749,9 @@ class ChatStatusMonitorV2:
             else:
                 self.region_label.config(text="Selection cancelled", foreground="orange")
         
+        # Give the window time to minimize without blocking the event loop
         selector = RegionSelector(on_region_selected)
-        selector.select()
+        self.root.after(300, selector.select)
         
     def preview_region(self):
         """Show the selected region with a border"""
@@ -502,26 +762,26 @@ class ChatStatusMonitorV2:
         x1, y1, x2, y2 = self.region
         
         # Capture just that region (works across monitors)
-        with mss() as sct:
-            monitor = {
-                "left": x1,
-                "top": y1, 
-                "width": x2 - x1,
-                "height": y2 - y1
-            }
-            try:
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not capture region: {e}")
-                return
+        monitor = {
+            "left": x1,
+            "top": y1, 
+            "width": x2 - x1,
+            "height": y2 - y1
+        }
+        try:
+            with self.sct_lock:
+                screenshot = self.thread_sct().grab(monitor)
+            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not capture region: {e}")
+            return
         
         # Show in a new window
         preview = tk.Toplevel(self.root)
         preview.title("Region Preview")
         preview.attributes('-topmost', True)
         
-        photo = ImageTk.PhotoImage(img)
+        photo = self.preview_photo(img)
         label = ttk.Label(preview, image=photo)
         label.image = photo  # Keep reference
         label.pack()
@@ -537,9 +797,15 @@ class ChatStatusMonitorV2:
         
         # Minimize main window
         self.root.iconify()
-        time.sleep(0.2)
         
         def on_calibrated(pos):
+            if pos:
+                # Let the overlay leave the screen, then check the click against the real pixels
+                self.root.after(150, lambda: finish(*self.snap_to_status_dot(pos), clicked=pos))
+            else:
+                finish(None)
+        
+        def finish(pos, outcome=None, clicked=None):
             self.root.deiconify()
             if pos:
                 self.status_position = pos
@@ -548,17 +814,63 @@ class ChatStatusMonitorV2:
                     foreground="green"
                 )
                 self.save_config_silent()
+                landed = {
+                    "on_dot": "Your click is on a coloured status dot.",
+                    "snapped": f"Your click at ({clicked[0]}, {clicked[1]}) was moved onto the status dot.",
+                    "not_found": "No status colour at or right next to your click - it was kept as-is\n"
+                                 "(expected if the person is offline right now).",
+                    "no_capture": "Couldn't capture the screen to check your click - it was kept as-is.",
+                }[outcome] + "\n"
                 messagebox.showinfo("Calibrated", 
                     f"Status position calibrated!\n\n"
-                    f"Position: ({pos[0]}, {pos[1]}) within the region\n\n"
+                    f"Position: ({pos[0]}, {pos[1]}) within the region\n"
+                    f"{landed}\n"
                     f"Click 'Test' to verify detection works."
                 )
             else:
                 self.calib_label.config(text="Calibration cancelled", foreground="orange")
         
         calibrator = StatusCalibrator(self.region, on_calibrated)
-        calibrator.calibrate()
+        self.root.after(200, calibrator.calibrate)
         
+    def snap_to_status_dot(self, pos: Tuple[int, int]) -> Tuple[Tuple[int, int], str]:
+        """Move a calibration click that landed beside the status dot onto the dot's coloured pixels.
+        Returns (position, outcome) - outcome is "on_dot", "snapped", "not_found" or "no_capture"."""
+        image = self.capture_region()
+        if image is None:
+            return pos, "no_capture"
+        
+        x, y = pos
+        r = self.STATUS_DOT_RADIUS
+        patch = np.ascontiguousarray(image[max(0, y-r):y+r, max(0, x-r):x+r, :3])
+        if patch.size == 0:
+            return pos, "not_found"
+        # One reduction over the HSV patch: a hit on the dot has a saturated average
+        if cv2.mean(cv2.cvtColor(patch, cv2.COLOR_BGR2HSV))[1] > 50:
+            return pos, "on_dot"
+        
+        # Missed (dot edge, background): look for a status-coloured blob just beside the click.
+        # Only status hues count, and only blobs centred within r - a grey (offline) dot
+        # next to a colourful avatar must keep the click, not jump onto the avatar.
+        x0, y0 = max(0, x - 2*r), max(0, y - 2*r)
+        area = np.ascontiguousarray(image[y0:y+2*r, x0:x+2*r, :3])
+        hsv = cv2.cvtColor(area, cv2.COLOR_BGR2HSV)
+        mask = cv2.inRange(hsv, _SV_LO, _SV_HI)
+        mask[_HUE_BITS[hsv[:, :, 0]] == 0] = 0
+        
+        n, _, stats, centroids = cv2.connectedComponentsWithStats(mask)
+        best, best_dist = None, r * r
+        for i in range(1, n):  # 0 is the background
+            if stats[i, cv2.CC_STAT_AREA] < 5:
+                continue
+            cx, cy = x0 + centroids[i][0], y0 + centroids[i][1]
+            dist = (cx - x) ** 2 + (cy - y) ** 2
+            if dist <= best_dist:
+                best, best_dist = (int(round(cx)), int(round(cy))), dist
+        if best is None:
+            return pos, "not_found"
+        return best, "snapped"
+    
     def browse_tesseract(self):
         """Browse for Tesseract executable"""
         path = filedialog.askopenfilename(
@@ -569,86 +881,275 @@ class ChatStatusMonitorV2:
             self.tesseract_path.delete(0, tk.END)
             self.tesseract_path.insert(0, path)
             
-    def capture_region(self) -> Optional[np.ndarray]:
-        """Capture just the selected region (works across monitors)"""
+    def capture_region(self, max_width: Optional[int] = None) -> Optional[np.ndarray]:
+        """Capture just the selected region (works across monitors), optionally only its left part.
+        Returns a BGRA image (alpha is unused)."""
         if not self.region:
             return None
         
         x1, y1, x2, y2 = self.region
-        
-        with mss() as sct:
-            # Use absolute coordinates - mss handles multi-monitor
-            monitor = {
-                "left": x1,
-                "top": y1,
-                "width": x2 - x1,
-                "height": y2 - y1
-            }
+        width = x2 - x1 if max_width is None else min(x2 - x1, max_width)
+        
+        # Use absolute coordinates - mss handles multi-monitor
+        monitor = {
+            "left": x1,
+            "top": y1,
+            "width": width,
+            "height": y2 - y1
+        }
+        try:
+            return self.grab(monitor)
+        except Exception as e:
+            print(f"Capture error: {e}")
+            return None
+    
+    def check_width(self) -> int:
+        """Columns of the region a check reads: the OCR'd sidebar and the status dot"""
+        width = self.SIDEBAR_WIDTH
+        if self.status_position:
+            width = max(width, self.status_position[0] + self.STATUS_DOT_RADIUS)
+        return width
+    
+    def thread_sct(self):
+        """The calling thread's mss session, created on its first grab"""
+        session = getattr(self.sct_local, "session", None)
+        if session is None:
+            session = self.sct_local.session = MssSession()
+        return session.sct
+    
+    def _grab_mss(self, monitor: dict) -> np.ndarray:
+        """Grab a screen area with mss"""
+        with self.sct_lock:
+            screenshot = self.thread_sct().grab(monitor)
+        # mss gives BGRA - wrap it as-is, no PIL/cvtColor copies. Consumers read BGRA
+        # directly: OpenCV converts a 4-channel image far faster than a 3-of-4 channel view.
+        return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+    
+    def _grab_dxcam(self, monitor: dict) -> np.ndarray:
+        """Grab a screen area with DXcam, falling back to mss off the primary display"""
+        left, top = monitor["left"], monitor["top"]
+        box = (left, top, left + monitor["width"], top + monitor["height"])
+        
+        # DXcam only sees the primary display
+        if left < 0 or top < 0 or box[2] > self.dx_camera.width or box[3] > self.dx_camera.height:
+            return self._grab_mss(monitor)
+        
+        with self.sct_lock:
+            frame = self.dx_camera.grab(region=box)
+        if frame is None:
+            # No new frame means the screen hasn't changed since the last grab
+            frame = self.dx_frames.get(box)
+            if frame is None:
+                return self._grab_mss(monitor)
+        self.dx_frames = {box: frame}
+        return frame
+    
+    def _make_grabber(self):
+        """Pick the screen capture backend: DXcam on Windows if installed, else mss"""
+        if DXCAM_AVAILABLE:
             try:
-                screenshot = sct.grab(monitor)
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                return cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+                self.dx_camera = dxcam.create(output_color="BGRA")
+                return self._grab_dxcam
             except Exception as e:
-                print(f"Capture error: {e}")
-                return None
+                print(f"DXcam unavailable, using mss: {e}")
+        return self._grab_mss
         
     def find_name_in_region(self, image: np.ndarray, target: str) -> Optional[Tuple[int, int, int, int]]:
         """Find the target name in the region image"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Crop to the sidebar before anything else - OCR time grows with pixel count.
+        # The crop starts at x=0, so box coordinates stay valid for the full image.
+        sidebar = image[:, :self.SIDEBAR_WIDTH]
         
-        # Set tesseract path
-        tess_path = self.tesseract_path.get()
-        if os.path.exists(tess_path):
-            pytesseract.pytesseract.tesseract_cmd = tess_path
+        tess_path = self.settings["tess_path"]
+        
+        # Sidebar looks like it did on a recent check? Reuse that answer, skip OCR.
+        # Several entries, since the list often flips between a few looks (hover, typing...).
+        # Hashed from the raw pixels so a cache hit never converts to gray.
+        cache_key = (target, tess_path, hash(sidebar[::16, ::16].tobytes()))
+        with self._ocr_cache_lock:
+            if cache_key in self._ocr_cache:
+                self._ocr_cache.move_to_end(cache_key)
+                return self._ocr_cache[cache_key]
         
         try:
-            data = pytesseract.image_to_data(gray, output_type=pytesseract.Output.DICT)
+            gray = cv2.cvtColor(sidebar, cv2.COLOR_BGRA2GRAY, dst=self._ocr_buffer("gray", sidebar.shape[:2]))
+            # The list scrolled or changed: look for the name's pixels before paying for OCR
+            result = self._match_name_template(gray, (target, tess_path))
+            if result is None:
+                result = self._ocr_find_name(gray, target, tess_path)
+                self._update_name_template(gray, (target, tess_path), result)
         except Exception as e:
             print(f"OCR Error: {e}")
-            return None
-        
-        target_words = target.lower().split()
-        first_word = target_words[0]
+            return None  # Not cached - try again next time
         
-        # Word variants for special characters
-        def get_variants(word):
-            variants = [word]
-            if 'ß' in word:
-                variants.extend([word.replace('ß', 'ss'), word.replace('ß', 'b')])
-            return variants
+        with self._ocr_cache_lock:
+            self._ocr_cache[cache_key] = result
+            if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return result
+    
+    def _ocr_buffer(self, name: str, shape: Tuple[int, int]) -> np.ndarray:
+        """This thread's reusable uint8 image for an OCR step (reallocated when the size changes)"""
+        buffers = self.ocr_buffers.__dict__
+        buf = buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = buffers[name] = np.empty(shape, np.uint8)
+        return buf
+    
+    def _match_name_template(self, gray: np.ndarray, key: tuple) -> Optional[Tuple[int, int, int, int]]:
+        """Find the name by matching the template cut from the last OCR hit (None = use OCR)"""
+        # Templates are replaced, never modified, so matching can run on this reference unlocked
+        with self.ocr_state_lock:
+            template = self.name_template
+            if template is None or key != self.name_template_key or self.template_hits >= self.TEMPLATE_MAX_HITS:
+                return None
+        if template.shape[0] > gray.shape[0] or template.shape[1] > gray.shape[1]:
+            return None
         
-        n_boxes = len(data['text'])
+        scores = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        _, best, _, (x, y) = cv2.minMaxLoc(scores)
+        if best < self.TEMPLATE_MIN_SCORE:
+            return None
         
-        for i in range(n_boxes):
-            text = data['text'][i].strip()
-            if not text or len(text) < 2:
-                continue
-            
-            text_lower = text.lower().rstrip(':.,;')
+        with self.ocr_state_lock:
+            if self.name_template is template:  # Not replaced by another thread meanwhile
+                self.template_hits += 1
+        h, w = template.shape
+        return (x, y, w, h)
+    
+    def _update_name_template(self, gray: np.ndarray, key: tuple, box: Optional[Tuple[int, int, int, int]]):
+        """Cut a fresh name template from an OCR result"""
+        template = None
+        if box:
+            x, y, w, h = box
+            if w > 0 and h > 0:
+                template = gray[y:y+h, x:x+w].copy()
+        with self.ocr_state_lock:
+            self.template_hits = 0
+            self.name_template = template
+            self.name_template_key = key
+    
+    def _ocr_find_name(self, gray: np.ndarray, target: str, tess_path: str) -> Optional[Tuple[int, int, int, int]]:
+        """Run OCR on the grayscale sidebar and match the target name"""
+        # Large (high-DPI) text OCRs just as well at a smaller size, and much faster
+        with self.ocr_state_lock:
+            scale = self.ocr_scale
+        if scale < 1.0:
+            h, w = gray.shape
+            small = self._ocr_buffer("small", (round(h * scale), round(w * scale)))
+            gray = cv2.resize(gray, small.shape[::-1], dst=small, interpolation=cv2.INTER_AREA)
+        binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10,
+                                       dst=self._ocr_buffer("binary", gray.shape))
+        
+        data = self._tesserocr_data(binary, tess_path) if TESSEROCR_AVAILABLE else None
+        if data is None:
+            data = pytesseract.image_to_data(binary, config=self.OCR_CONFIG, output_type=pytesseract.Output.DICT)
+        
+        first_match, second_match = compile_target(target)
+        
+        # Clean every token once, then pick first-word candidates in a single pass
+        words = [t.strip().lower() for t in data['text']]
+        bare_words = [w.rstrip(':.,;') for w in words]  # Without trailing punctuation
+        lefts = np.asarray(data['left'])
+        tops = np.asarray(data['top'])
+        widths = np.asarray(data['width'])
+        heights = np.asarray(data['height'])
+        n_boxes = len(words)
+        
+        # Back to full-size coordinates
+        if scale < 1.0:
+            lefts, tops, widths, heights = [np.rint(a / scale).astype(int) for a in (lefts, tops, widths, heights)]
+        
+        # Pick next OCR's scale from this run's text height (only ever shrink)
+        word_heights = heights[[bool(w) for w in words]] if n_boxes else heights
+        if word_heights.size:
+            new_scale = min(1.0, max(0.5, self.OCR_TEXT_HEIGHT / float(np.median(word_heights))))
+            with self.ocr_state_lock:
+                self.ocr_scale = new_scale
+        
+        candidates = np.flatnonzero([
+            len(w) >= 2 and first_match(bare) is not None
+            for w, bare in zip(words, bare_words)
+        ])
+        
+        # The image is only the sidebar, so every box is a valid hit: return the first
+        # (topmost) full-name match, else the first first-name-only match
+        first_only = None
+        for i in candidates:
+            x, y, w, h = int(lefts[i]), int(tops[i]), int(widths[i]), int(heights[i])
             
-            # Check first word match
-            if first_word in text_lower or text_lower.startswith(first_word[:3]):
-                x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
-                
-                # If multi-word name, look for second word nearby
-                if len(target_words) >= 2:
-                    second_variants = get_variants(target_words[1])
-                    
-                    for j in range(max(0, i-2), min(n_boxes, i+5)):
-                        if j == i:
-                            continue
-                        nearby = data['text'][j].strip().lower()
-                        if abs(data['top'][j] - y) < 20:  # Same line
-                            for var in second_variants:
-                                if var[:4] in nearby or nearby[:4] in var:
-                                    # Combine boxes
-                                    x2 = max(x + w, data['left'][j] + data['width'][j])
-                                    w = x2 - x
-                                    return (x, y, w, h)
-                
+            if second_match is None:
                 return (x, y, w, h)
+            
+            # Multi-word name: look for second word nearby on the same line
+            nearby_idx = np.arange(max(0, i - 2), min(n_boxes, i + 5))
+            nearby_idx = nearby_idx[(nearby_idx != i) & (np.abs(tops[nearby_idx] - y) < 20)]
+            
+            for j in nearby_idx:
+                nearby = words[j]
+                if not nearby:  # Tesseract's block/line rows have no text
+                    continue
+                if second_match(nearby):
+                    # Combine boxes
+                    x2 = max(x + w, int(lefts[j] + widths[j]))
+                    return (x, y, x2 - x, h)
+            
+            if first_only is None:
+                first_only = (x, y, w, h)
         
-        return None
+        return first_only
+    
+    def warm_up_ocr(self, tess_path: str):
+        """Run one tiny OCR so the first real check doesn't pay for loading Tesseract"""
+        blank = np.full((32, 32), 255, np.uint8)
+        try:
+            if TESSEROCR_AVAILABLE and self._tesserocr_data(blank, tess_path) is not None:
+                return
+            # pytesseract: at least gets tesseract.exe and its language data into the OS file cache
+            pytesseract.image_to_data(blank, config=self.OCR_CONFIG)
+        except Exception:
+            pass  # Tesseract missing - the real check reports it
+    
+    def _tesserocr_data(self, binary: np.ndarray, tess_path: str) -> Optional[dict]:
+        """OCR with the in-process tesserocr engine; same dict as pytesseract's image_to_data.
+        Returns None if the engine can't be loaded or the app is closing (caller falls back to pytesseract)."""
+        with self.tess_lock:
+            if self.closing:
+                return None  # Engine was freed by exit_app - don't touch or re-create it
+            if tess_path != self.tess_api_path:
+                if self.tess_api:
+                    self.tess_api.End()
+                self.tess_api = None
+                self.tess_api_path = tess_path  # Don't retry a bad path every check
+                
+                # Use the tessdata next to the configured tesseract.exe, else tesserocr's default
+                tessdata_dir = os.path.join(os.path.dirname(tess_path), "tessdata") if os.path.exists(tess_path) else ""
+                kwargs = {"psm": tesserocr.PSM.SINGLE_BLOCK, "oem": tesserocr.OEM.LSTM_ONLY}  # Same as OCR_CONFIG
+                if tessdata_dir:
+                    kwargs["path"] = tessdata_dir
+                try:
+                    self.tess_api = tesserocr.PyTessBaseAPI(**kwargs)
+                except Exception as e:
+                    print(f"tesserocr unavailable, using pytesseract: {e}")
+            if not self.tess_api:
+                return None
+            
+            h, w = binary.shape
+            self.tess_api.SetImageBytes(binary.tobytes(), w, h, 1, w)
+            tsv = self.tess_api.GetTSVText(0)
+        
+        # level page block par line word left top width height conf text
+        data = {'text': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        for row in tsv.splitlines():
+            cols = row.split('\t')
+            if len(cols) < 12:
+                continue
+            data['left'].append(int(cols[6]))
+            data['top'].append(int(cols[7]))
+            data['width'].append(int(cols[8]))
+            data['height'].append(int(cols[9]))
+            data['text'].append(cols[11])
+        return data
     
     def detect_status_color(self, image: np.ndarray, name_box: Tuple[int, int, int, int]) -> str:
         """Detect status color using calibrated position"""
@@ -657,30 +1158,37 @@ class ChatStatusMonitorV2:
             x, y, w, h = name_box
             search_x = max(0, x - 50)
             search_y = max(0, y)
+            search_size = 30
         else:
-            # Use calibrated position (relative to region)
-            search_x = max(0, self.status_position[0] - 15)
-            search_y = max(0, self.status_position[1] - 15)
+            # Use calibrated position (relative to region) - the dot is small, keep the box tight
+            search_x = max(0, self.status_position[0] - self.STATUS_DOT_RADIUS)
+            search_y = max(0, self.status_position[1] - self.STATUS_DOT_RADIUS)
+            search_size = 2 * self.STATUS_DOT_RADIUS
         
-        search_size = 30
-        region = image[search_y:search_y+search_size, search_x:search_x+search_size]
+        region = image[search_y:search_y+search_size, search_x:search_x+search_size, :3]
         
         if region.size == 0:
             return "unknown"
         
-        hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
-        
-        # Color detection
-        green_mask = cv2.inRange(hsv, np.array([35, 80, 80]), np.array([85, 255, 255]))
-        red_mask1 = cv2.inRange(hsv, np.array([0, 80, 80]), np.array([10, 255, 255]))
-        red_mask2 = cv2.inRange(hsv, np.array([160, 80, 80]), np.array([180, 255, 255]))
-        yellow_mask = cv2.inRange(hsv, np.array([15, 80, 80]), np.array([35, 255, 255]))
-        
-        green_px = cv2.countNonZero(green_mask)
-        red_px = cv2.countNonZero(cv2.bitwise_or(red_mask1, red_mask2))
-        yellow_px = cv2.countNonZero(yellow_mask)
+        if NUMBA_AVAILABLE:
+            # One fused pass over the patch (JIT-compiled)
+            green_px, red_px, yellow_px = _count_status_pixels(np.ascontiguousarray(region))
+        else:
+            hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
+            
+            # One sat/val mask + a hue lookup instead of four inRange passes
+            sv_mask = cv2.inRange(hsv, _SV_LO, _SV_HI)
+            bits = _HUE_BITS[hsv[:, :, 0][sv_mask > 0]]
+            
+            # One histogram pass over the colour bits instead of three count passes
+            hist = np.bincount(bits, minlength=8)
+            green_px = int(hist[1::2].sum())       # bit 1 set: 1, 3, 5, 7
+            red_px = int(hist[[2, 3, 6, 7]].sum())  # bit 2 set
+            yellow_px = int(hist[4:].sum())         # bit 4 set: 4-7
         
-        print(f"Colors - G:{green_px} R:{red_px} Y:{yellow_px}")
+        if DEBUG:
+            print(f"Colors - G:{green_px} R:{red_px} Y:{yellow_px}")
+            self._save_debug_images(image, search_x, search_y, search_size)
         
         if green_px > 5 and green_px >= red_px and green_px >= yellow_px:
             return "green"
@@ -691,6 +1199,18 @@ class ChatStatusMonitorV2:
         
         return "unknown"
     
+    def _save_debug_images(self, image: np.ndarray, search_x: int, search_y: int, search_size: int):
+        """Save the area around the status search box to debug_context.png"""
+        ctx_x = max(0, search_x - 50)
+        ctx_y = max(0, search_y - 50)
+        context = image[ctx_y:search_y+search_size+50, ctx_x:search_x+search_size+50, :3].copy()
+        
+        rx, ry = search_x - ctx_x, search_y - ctx_y
+        cv2.rectangle(context, (rx, ry), (rx+search_size, ry+search_size), (255, 0, 0), 1)
+        
+        # Low compression - debug images are written every check
+        cv2.imwrite(_DEBUG_CONTEXT_PATH, context, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    
     def test_detection(self):
         """Test the detection with current settings"""
         if not self.region:
@@ -698,59 +1218,69 @@ class ChatStatusMonitorV2:
             return
         
         self.status_label.config(text="🔄 Testing...")
-        self.root.update()
-        
-        # Capture region
-        image = self.capture_region()
-        if image is None:
-            self.status_label.config(text="❌ Capture failed")
-            return
+        self.last_ui_texts = None  # Let a running monitor repost its status afterwards
         
-        # Find name
+        # Capture + OCR off the UI thread so the window keeps repainting
         target = self.person_entry.get()
-        name_box = self.find_name_in_region(image, target)
-        
+        threading.Thread(target=self._run_test, args=(target,), daemon=True).start()
+    
+    def _run_test(self, target: str):
+        """Worker half of test_detection - always hands a result (or the error) back to the Tk thread"""
+        try:
+            # Capture region
+            image = self.capture_region()
+            if image is None:
+                self.root.after(0, lambda: self.status_label.config(text="❌ Capture failed"))
+                return
+            
+            # Find name
+            name_box = self.find_name_in_region(image, target)
+            status = self.detect_status_color(image, name_box) if name_box else None
+            
+            # Decode, mark up and shrink the preview here too - the Tk thread only wraps it in a PhotoImage
+            pil_img = self.capture_to_pil(image)
+            if name_box:
+                self.draw_test_boxes(pil_img, name_box)
+            self.shrink_for_preview(pil_img)
+        except Exception as e:
+            print(f"Test error: {e}")
+            self.root.after(0, self._show_test_error, str(e))
+            return
+        self.root.after(0, self._show_test_outcome, pil_img, target, name_box, status)
+    
+    def _show_test_error(self, error: str):
+        """Report a test_detection run that failed with an exception"""
+        self.status_label.config(text="❌ Test failed")
+        self.detection_label.config(text="See the error message for details")
+        messagebox.showerror("Test Failed", f"The detection test failed:\n\n{error}")
+    
+    def _show_test_outcome(self, pil_img: Image.Image, target: str, name_box: Optional[Tuple[int, int, int, int]], status: Optional[str]):
+        """Update the UI with a test_detection result"""
         if name_box:
             x, y, w, h = name_box
-            status = self.detect_status_color(image, name_box)
             
             self.status_label.config(text=f"✅ Found: {target}")
             self.detection_label.config(text=f"Position: ({x}, {y}) - Status: {status.upper()}")
             
             # Show visual result
-            self.show_test_result(image, name_box, status)
+            self.show_test_result(pil_img, name_box, status)
         else:
             self.status_label.config(text=f"❌ Not found: {target}")
             self.detection_label.config(text="Check if name is visible in the selected region")
             
             # Show what was captured
-            self.show_captured_region(image)
+            self.show_captured_region(pil_img)
     
-    def show_test_result(self, image: np.ndarray, name_box: Tuple[int, int, int, int], status: str):
-        """Show test result in a window"""
+    def show_test_result(self, pil_img: Image.Image, name_box: Tuple[int, int, int, int], status: str):
+        """Show test result (preview already marked up by draw_test_boxes) in a window"""
         x, y, w, h = name_box
         
-        # Draw rectangles on image
-        img_copy = image.copy()
-        
-        # Name box (green)
-        cv2.rectangle(img_copy, (x, y), (x+w, y+h), (0, 255, 0), 2)
-        
-        # Status search area (blue)
-        if self.status_position:
-            sx, sy = self.status_position
-            cv2.rectangle(img_copy, (sx-15, sy-15), (sx+15, sy+15), (255, 0, 0), 2)
-        
-        # Convert to PIL
-        img_rgb = cv2.cvtColor(img_copy, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(img_rgb)
-        
         # Show window
         preview = tk.Toplevel(self.root)
         preview.title(f"Test Result - Status: {status.upper()}")
         preview.attributes('-topmost', True)
         
-        photo = ImageTk.PhotoImage(pil_img)
+        photo = self.preview_photo(pil_img)
         label = ttk.Label(preview, image=photo)
         label.image = photo
         label.pack()
@@ -759,16 +1289,13 @@ class ChatStatusMonitorV2:
         ttk.Label(preview, text=info, justify=tk.LEFT).pack(pady=5)
         ttk.Button(preview, text="Close", command=preview.destroy).pack(pady=5)
         
-    def show_captured_region(self, image: np.ndarray):
+    def show_captured_region(self, pil_img: Image.Image):
         """Show what was captured (for debugging)"""
-        img_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(img_rgb)
-        
         preview = tk.Toplevel(self.root)
         preview.title("Captured Region (Name not found)")
         preview.attributes('-topmost', True)
         
-        photo = ImageTk.PhotoImage(pil_img)
+        photo = self.preview_photo(pil_img)
         label = ttk.Label(preview, image=photo)
         label.image = photo
         label.pack()
@@ -776,6 +1303,36 @@ class ChatStatusMonitorV2:
         ttk.Label(preview, text="This is what was captured.\nMake sure the person's name is visible here.").pack(pady=5)
         ttk.Button(preview, text="Close", command=preview.destroy).pack(pady=5)
     
+    def capture_to_pil(self, image: np.ndarray) -> Image.Image:
+        """RGB PIL image of a BGRA capture, decoded in one pass (like preview_region does)"""
+        h, w = image.shape[:2]
+        return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(image), "raw", "BGRX", 0, 1)
+    
+    def draw_test_boxes(self, pil_img: Image.Image, name_box: Tuple[int, int, int, int]):
+        """Mark the name box and the status search area on a decoded capture"""
+        # Drawn on the decoded copy - the capture itself may be a read-only mss buffer
+        # or a frame DXcam hands out again, so it is never drawn on
+        x, y, w, h = name_box
+        draw = ImageDraw.Draw(pil_img)
+        
+        # Name box (green)
+        draw.rectangle((x, y, x+w, y+h), outline=(0, 255, 0), width=2)
+        
+        # Status search area (blue)
+        if self.status_position:
+            sx, sy = self.status_position
+            r = self.STATUS_DOT_RADIUS
+            draw.rectangle((sx-r, sy-r, sx+r, sy+r), outline=(0, 0, 255), width=2)
+    
+    def shrink_for_preview(self, img: Image.Image):
+        """Shrink a big capture in place to PREVIEW_MAX_SIZE (no-op for small ones)"""
+        img.thumbnail(self.PREVIEW_MAX_SIZE, Image.Resampling.BILINEAR)
+    
+    def preview_photo(self, img: Image.Image) -> ImageTk.PhotoImage:
+        """PhotoImage for a preview window - big captures are shrunk first, so Tk copies far fewer pixels"""
+        self.shrink_for_preview(img)
+        return ImageTk.PhotoImage(img)
+    
     def toggle_monitoring(self):
         """Start or stop monitoring"""
         if self.running:
@@ -792,72 +1349,121 @@ class ChatStatusMonitorV2:
         self.running = True
         self.start_btn.config(text="⏹️ Stop Monitoring")
         self.status_label.config(text="▶️ Monitoring...")
+        self.last_ui_texts = None  # Labels were changed here - next check must repost
         
-        self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
+        # Fresh event per run, so a stopped thread still sleeping can't resume
+        self.stop_event = threading.Event()
+        self.monitor_thread = threading.Thread(target=self.monitor_loop, args=(self.stop_event,), daemon=True)
         self.monitor_thread.start()
         
     def stop_monitoring(self):
         """Stop monitoring"""
         self.running = False
+        self.stop_event.set()
         self.start_btn.config(text="▶️ Start Monitoring")
         self.status_label.config(text="⏸️ Stopped")
         
-    def monitor_loop(self):
+    def monitor_loop(self, stop_event: threading.Event):
         """Background monitoring loop"""
-        while self.running:
+        next_check = time.monotonic()
+        idle_checks = 0  # Checks in a row that saw the same screen
+        while not stop_event.is_set():
+            changed = True
             try:
-                image = self.capture_region()
-                if image is None:
-                    continue
-                
-                target = self.person_entry.get()
-                name_box = self.find_name_in_region(image, target)
-                
-                if name_box:
-                    status = self.detect_status_color(image, name_box)
-                    
-                    # Update UI
-                    self.root.after(0, lambda s=status: self.status_label.config(text=f"✅ {target}: {s.upper()}"))
-                    self.root.after(0, lambda s=status: self.detection_label.config(text=f"Last check: {time.strftime('%H:%M:%S')}"))
-                    
-                    # Check for status change
-                    if status != self.last_status and status in ['green', 'red']:
-                        should_notify = (
-                            (status == 'green' and self.notify_green.get()) or
-                            (status == 'red' and self.notify_red.get())
-                        )
-                        if should_notify and self.email_enabled.get():
-                            self.send_notification(target, status)
-                        self.last_status = status
-                else:
-                    self.root.after(0, lambda: self.status_label.config(text=f"🔍 Searching for {target}..."))
-                    
+                changed = self.check_status()
             except Exception as e:
                 print(f"Monitor error: {e}")
-                
-            time.sleep(int(self.interval_var.get()))
+            
+            # Nothing moving on screen: check less often (2x, 4x... up to IDLE_MAX_DELAY)
+            idle_checks = 0 if changed else idle_checks + 1
+            interval = self.settings["interval"]
+            delay = min(interval << min(idle_checks, 4), max(interval, self.IDLE_MAX_DELAY))
+            
+            # Fixed schedule (check time doesn't stretch the interval); restart it if a check overran
+            next_check = max(next_check + delay, time.monotonic())
+            
+            # Wakes up immediately when monitoring is stopped
+            stop_event.wait(next_check - time.monotonic())
+    
+    def check_status(self) -> bool:
+        """One capture -> OCR -> colour check, posting the result to the UI.
+        Returns False if the screen looked the same as on the previous check."""
+        image = self.capture_region(self.check_width())
+        if image is None:
+            return True
+        
+        # Stride 4 still samples every status dot pixel block, so a colour change shows up
+        look = hash(image[::4, ::4].tobytes())
+        changed = look != self.last_look
+        self.last_look = look
+        
+        settings = self.settings
+        target = settings["target"]
+        
+        # Same pixels and setup as the last hit? Same answer - skip OCR and colour detection
+        key = (look, target, self.region, self.status_position)
+        if self.last_found and self.last_found[:4] == key:
+            status = self.last_found[4]
+        else:
+            name_box = self.find_name_in_region(image, target)
+            status = self.detect_status_color(image, name_box) if name_box else None
+            self.last_found = (*key, status) if status else None
+        
+        if status:
+            # Update UI
+            self.post_ui_update(f"✅ {target}: {status.upper()}", f"Last check: {time.strftime('%H:%M:%S')}")
+            
+            # Check for status change
+            if status != self.last_status and status in ['green', 'red']:
+                should_notify = (
+                    (status == 'green' and settings["notify_green"]) or
+                    (status == 'red' and settings["notify_red"])
+                )
+                if should_notify and settings["email_enabled"]:
+                    # SMTP can take seconds - don't hold up the next check
+                    threading.Thread(target=self.send_notification, args=(target, status), daemon=True).start()
+                self.last_status = status
+        else:
+            self.post_ui_update(f"🔍 Searching for {target}...")
+        return changed
+    
+    def post_ui_update(self, status_text: str, detection_text: Optional[str] = None):
+        """Hand label texts to the Tk thread in one event, and only when they changed"""
+        texts = (status_text, detection_text)
+        if texts == self.last_ui_texts:
+            return
+        self.last_ui_texts = texts
+        self.root.after(0, self._apply_ui_update, status_text, detection_text)
+    
+    def _apply_ui_update(self, status_text: str, detection_text: Optional[str]):
+        """Set the status labels (Tk thread); None leaves a label as it is"""
+        self.status_label.config(text=status_text)
+        if detection_text is not None:
+            self.detection_label.config(text=detection_text)
     
     def can_send_email(self) -> Tuple[bool, str]:
         """Check email constraints"""
-        try:
-            berlin_tz = ZoneInfo("Europe/Berlin")
-            now_berlin = datetime.now(berlin_tz)
-        except:
-            now_berlin = datetime.now()
+        settings = self.settings
+        now_berlin = datetime.now(BERLIN_TZ)
         
-        if now_berlin.hour < int(self.email_start_hour.get()):
-            return False, f"Before {self.email_start_hour.get()}:00"
+        if now_berlin.hour < settings["email_start_hour"]:
+            return False, f"Before {settings['email_start_hour']}:00"
         
-        if self.last_email_time:
-            minutes_since = (datetime.now() - self.last_email_time).total_seconds() / 60
-            rate_limit = int(self.email_rate_limit.get())
+        if self.last_email_time is not None:
+            minutes_since = (time.monotonic() - self.last_email_time) / 60
+            rate_limit = settings["email_rate_limit"]
             if minutes_since < rate_limit:
                 return False, f"Rate limited ({rate_limit - minutes_since:.0f} min left)"
         
         return True, "OK"
     
     def send_notification(self, name: str, status: str):
-        """Send email notification"""
+        """Send email notification (one at a time - each runs on its own thread)"""
+        with self.email_lock:
+            self._send_notification(name, status)
+    
+    def _send_notification(self, name: str, status: str):
+        """Check the email limits and send"""
         can_send, reason = self.can_send_email()
         if not can_send:
             print(f"Email blocked: {reason}")
@@ -868,31 +1474,70 @@ class ChatStatusMonitorV2:
             return
         
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email.get()
-            msg['To'] = self.recipient_email.get()
+            msg = EmailMessage()
+            msg['From'] = self.settings["sender_email"]
+            msg['To'] = self.settings["recipient_email"]
             msg['Subject'] = f"Status Alert: {name} is now {status.upper()}"
             
-            try:
-                berlin_time = datetime.now(ZoneInfo("Europe/Berlin")).strftime('%Y-%m-%d %H:%M:%S %Z')
-            except:
+            if BERLIN_TZ:
+                berlin_time = datetime.now(BERLIN_TZ).strftime('%Y-%m-%d %H:%M:%S %Z')
+            else:
                 berlin_time = time.strftime('%Y-%m-%d %H:%M:%S')
             
             body = f"Person: {name}\nStatus: {status.upper()}\nTime: {berlin_time}"
-            msg.attach(MIMEText(body, 'plain'))
+            msg.set_content(body)
             
-            with smtplib.SMTP(self.smtp_server.get(), int(self.smtp_port.get())) as server:
-                server.starttls()
-                server.login(self.sender_email.get(), self.sender_password.get())
+            server = self._get_smtp()
+            try:
                 server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the liveness check and the send - retry once on a new session
+                self._close_smtp()
+                server = self._get_smtp()
+                server.send_message(msg)
+            self.smtp_sent += 1
             
-            self.last_email_time = datetime.now()
+            self.last_email_time = time.monotonic()
             self.last_notified_status = status
             print(f"✉️ Email sent: {name} is {status}")
             
         except Exception as e:
+            self._close_smtp()
             print(f"Email error: {e}")
     
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a logged-in SMTP session, reusing the last one while it is still alive"""
+        settings = self.settings
+        key = (settings["smtp_server"], settings["smtp_port"], settings["sender_email"], settings["sender_password"])
+        
+        if self.smtp and (key != self.smtp_key or self.smtp_sent >= self.SMTP_MAX_MESSAGES
+                          or time.monotonic() - self.smtp_used > self.SMTP_IDLE_TIMEOUT):
+            self._close_smtp()
+        if self.smtp:
+            try:
+                if self.smtp.noop()[0] != 250:
+                    self._close_smtp()
+            except (smtplib.SMTPException, OSError):
+                self._close_smtp()
+        
+        if not self.smtp:
+            server = smtplib.SMTP(key[0], key[1], timeout=self.SMTP_TIMEOUT)
+            server.starttls()
+            server.login(key[2], key[3])
+            self.smtp, self.smtp_key, self.smtp_sent = server, key, 0
+        
+        self.smtp_used = time.monotonic()
+        return self.smtp
+    
+    def _close_smtp(self):
+        """Log out of the reused SMTP session, if any"""
+        if self.smtp:
+            try:
+                self.smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.smtp = None
+    
     # === SYSTEM TRAY ===
     
     def minimize_to_tray(self):
@@ -903,18 +1548,21 @@ class ChatStatusMonitorV2:
         
         self.root.withdraw()
         
-        # Create tray icon
-        icon_image = Image.new('RGB', (64, 64), color='green')
-        draw = ImageDraw.Draw(icon_image)
-        draw.ellipse([16, 16, 48, 48], fill='lime')
-        
-        menu = (
-            item('Show Window', self.show_from_tray),
-            item('Start Monitoring', self.start_monitoring),
-            item('Stop Monitoring', self.stop_monitoring),
-            item('Exit', self.exit_app)
-        )
+        # Build the tray image and menu on first use, then reuse them on every minimize
+        if self.tray_parts is None:
+            icon_image = Image.new('RGB', (64, 64), color='green')
+            draw = ImageDraw.Draw(icon_image)
+            draw.ellipse([16, 16, 48, 48], fill='lime')
+            
+            menu = (
+                item('Show Window', self.show_from_tray),
+                item('Start Monitoring', self.start_monitoring),
+                item('Stop Monitoring', self.stop_monitoring),
+                item('Exit', self.exit_app)
+            )
+            self.tray_parts = (icon_image, menu)
         
+        icon_image, menu = self.tray_parts
         self.tray_icon = pystray.Icon("ChatMonitor", icon_image, "Chat Status Monitor", menu)
         threading.Thread(target=self.tray_icon.run, daemon=True).start()
         
@@ -929,8 +1577,25 @@ class ChatStatusMonitorV2:
     def exit_app(self):
         """Exit application"""
         self.running = False
+        self.stop_event.set()
         if self.tray_icon:
             self.tray_icon.stop()
+        with self.sct_lock:
+            self.sct_local.__dict__.pop("session", None)  # Tk thread's session; workers' close as they end
+            if self.dx_camera:
+                self.dx_camera.release()
+        with self.tess_lock:
+            self.closing = True
+            if self.tess_api:
+                self.tess_api.End()
+            self.tess_api = None
+            self.tess_api_path = None
+        # Don't close the session under a send in progress; after 5 s, exit without the polite QUIT
+        if self.email_lock.acquire(timeout=5):
+            try:
+                self._close_smtp()
+            finally:
+                self.email_lock.release()
         self.root.destroy()
         
     def on_close(self):
@@ -967,9 +1632,22 @@ class ChatStatusMonitorV2:
             "email_rate_limit": self.email_rate_limit.get(),
         }
         
+        # Nothing changed since our last write (and nobody else touched the file)? Skip it
+        if config == self.saved_config and self._config_mtime() == self.config_mtime:
+            return True
+        
         try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(config, indent=2).encode('utf-8')
+            # Write a temp file and swap it in, so a crash mid-write can't leave a truncated config
+            tmp_path = self.CONFIG_FILE + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.CONFIG_FILE)
+            self.saved_config = config
+            self.config_mtime = self._config_mtime()
             return True
         except Exception as e:
             print(f"Save error: {e}")
@@ -977,12 +1655,18 @@ class ChatStatusMonitorV2:
             
     def load_config(self):
         """Load saved config"""
-        if not os.path.exists(self.CONFIG_FILE):
-            return
+        mtime = self._config_mtime()
+        if mtime is None or mtime == self.config_mtime:
+            return  # No file, or already loaded this version
         
         try:
-            with open(self.CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.CONFIG_FILE, 'rb') as f:
+                    config = orjson.loads(f.read())
+            else:
+                with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            self.config_mtime = mtime
             
             if config.get("region"):
                 self.region = tuple(config["region"])
@@ -1028,6 +1712,13 @@ class ChatStatusMonitorV2:
         except Exception as e:
             print(f"Load error: {e}")
     
+    def _config_mtime(self) -> Optional[int]:
+        """CONFIG_FILE's modification time, or None if it doesn't exist"""
+        try:
+            return os.stat(self.CONFIG_FILE).st_mtime_ns
+        except OSError:
+            return None
+    
     def run(self):
         """Run the application"""
         self.root.mainloop()